@@ -0,0 +1,34 @@
+import zlib
+from typing import Optional, Tuple
+
+from config import post_compression_threshold, post_compression_level
+
+CODEC_ZLIB = "zlib"
+
+def compress_content(content: str) -> Tuple[str, Optional[bytes], Optional[str]]:
+    """
+    Подготовить содержание поста к записи в БД.
+    Возвращает (content, content_blob, content_codec): короткие тексты
+    хранятся как есть, длинные - сжатыми в content_blob.
+    """
+
+    data = content.encode("utf-8")
+    if post_compression_threshold <= 0 or len(data) < post_compression_threshold:
+        return content, None, None
+
+    compressed = zlib.compress(data, post_compression_level)
+    if len(compressed) >= len(data):
+        return content, None, None
+
+    return "", compressed, CODEC_ZLIB
+
+def decompress_content(content: str, content_blob: Optional[bytes], content_codec: Optional[str]) -> str:
+    """Восстановить содержание поста из полей БД"""
+
+    if content_codec is None:
+        return content
+
+    if content_codec == CODEC_ZLIB:
+        return zlib.decompress(content_blob).decode("utf-8")
+
+    raise ValueError(f"Неизвестный кодек содержания поста: {content_codec}")
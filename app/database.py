@@ -7,6 +7,10 @@ def init_database():
     with sqlite3.connect(database_name) as conn:
         cursor = conn.cursor()
 
+        # Действует только на новую базу, старые переводит vacuum_database.py
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        cursor.execute("PRAGMA journal_mode = WAL")
+
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS users (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -21,6 +25,8 @@ def init_database():
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     title TEXT NOT NULL,
                     content TEXT NOT NULL,
+                    content_blob BLOB,
+                    content_codec TEXT,
                     author_id INTEGER NOT NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -28,6 +34,14 @@ def init_database():
                 )
             ''')
 
+        # Миграция старых баз без колонок для сжатого содержания
+        cursor.execute("PRAGMA table_info(posts)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if "content_blob" not in columns:
+            cursor.execute("ALTER TABLE posts ADD COLUMN content_blob BLOB")
+        if "content_codec" not in columns:
+            cursor.execute("ALTER TABLE posts ADD COLUMN content_codec TEXT")
+
         conn.commit()
 
 @contextmanager
@@ -0,0 +1,217 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from app.database import get_db_connection
+from config import (
+    maintenance_interval,
+    maintenance_truncate_interval,
+    maintenance_analyze_interval,
+    maintenance_budget_ms,
+    maintenance_analysis_limit,
+    maintenance_vacuum_step_pages,
+    maintenance_max_latency_ms,
+    maintenance_max_active_requests,
+)
+
+class DatabaseMaintenance:
+    """
+    Фоновое обслуживание БД: WAL checkpoint, ограниченный ANALYZE
+    и incremental_vacuum небольшими шагами в общем лимите времени.
+    Проход пропускается, пока приложение нагружено.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._active_requests = 0
+        self._latency_ms = 0.0
+        self._last_request_at = 0.0
+
+        self._last_truncate_at: Optional[float] = None
+        self._last_analyze_at: Optional[float] = None
+        self._backoff = 1
+
+        self._stats = {
+            "runs": 0,
+            "skipped_runs": 0,
+            "last_skip_reason": None,
+            "last_run": None
+        }
+
+    def start(self):
+        """Запустить фоновый поток"""
+
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="db-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Остановить фоновый поток"""
+
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def request_started(self):
+        with self._lock:
+            self._active_requests += 1
+
+    def request_finished(self, latency_ms: float):
+        """Учесть время ответа запроса (скользящее среднее)"""
+
+        with self._lock:
+            self._active_requests -= 1
+            self._latency_ms = 0.8 * self._latency_ms + 0.2 * latency_ms
+            self._last_request_at = time.monotonic()
+
+    def get_stats(self) -> dict:
+        """Статистика последнего прохода"""
+
+        with self._lock:
+            return {
+                **self._stats,
+                "active_requests": self._active_requests,
+                "avg_latency_ms": round(self._latency_ms, 2),
+                "backoff": self._backoff
+            }
+
+    def _busy_reason(self) -> Optional[str]:
+        with self._lock:
+            if self._active_requests > maintenance_max_active_requests:
+                return "ACTIVE_REQUESTS"
+
+            # Среднее без свежих запросов устаревает и не считается нагрузкой
+            recent = time.monotonic() - self._last_request_at < maintenance_interval
+            if recent and self._latency_ms > maintenance_max_latency_ms:
+                return "HIGH_LATENCY"
+
+        return None
+
+    def _loop(self):
+        while not self._stop_event.wait(maintenance_interval * self._backoff):
+            reason = self._busy_reason()
+            if reason:
+                with self._lock:
+                    self._stats["skipped_runs"] += 1
+                    self._stats["last_skip_reason"] = reason
+                    self._backoff = min(self._backoff * 2, 8)
+                continue
+
+            try:
+                run = self.run_once()
+            except Exception as e:
+                run = {"error": str(e)}
+
+            with self._lock:
+                self._stats["runs"] += 1
+                self._stats["last_run"] = run
+                # Checkpoint упёрся в читателей - не долбим базу каждый проход
+                if run.get("checkpoint", {}).get("busy"):
+                    self._backoff = min(self._backoff * 2, 8)
+                else:
+                    self._backoff = 1
+
+    def run_once(self) -> dict:
+        """Выполнить один проход обслуживания"""
+
+        started = time.monotonic()
+        run = {"started_at": datetime.utcnow().isoformat()}
+
+        deadline = started + maintenance_budget_ms / 1000
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            # Ожидание блокировок тоже укладывается в лимит прохода,
+            # иначе TRUNCATE при долгом читателе держит писателей 5 секунд
+            cursor.execute(f"PRAGMA busy_timeout = {maintenance_budget_ms}")
+
+            mode = "PASSIVE"
+            if self._due(self._last_truncate_at, maintenance_truncate_interval, started):
+                mode = "TRUNCATE"
+            cursor.execute(f"PRAGMA wal_checkpoint({mode})")
+            busy, log_frames, checkpointed = cursor.fetchone()
+            if mode == "TRUNCATE" and not busy:
+                self._last_truncate_at = started
+            run["checkpoint"] = {
+                "mode": mode,
+                "busy": bool(busy),
+                "log_frames": log_frames,
+                "checkpointed_frames": checkpointed
+            }
+
+            run["analyzed"] = False
+            if self._due(self._last_analyze_at, maintenance_analyze_interval, started):
+                run["analyzed"] = self._analyze(conn, deadline)
+                if run["analyzed"]:
+                    self._last_analyze_at = started
+
+            run["vacuum"] = self._incremental_vacuum(conn, deadline)
+
+        run["duration_ms"] = round((time.monotonic() - started) * 1000, 2)
+        return run
+
+    @staticmethod
+    def _due(last_run_at: Optional[float], interval: int, now: float) -> bool:
+        return last_run_at is None or now - last_run_at >= interval
+
+    @staticmethod
+    def _analyze(conn: sqlite3.Connection, deadline: float) -> bool:
+        """
+        ANALYZE по выборке строк. PRAGMA optimize здесь не подходит:
+        в новом соединении он не видит ни одной использованной таблицы.
+        Прерывается по лимиту времени, тогда повторится в следующем проходе.
+        """
+
+        conn.execute(f"PRAGMA analysis_limit = {maintenance_analysis_limit}")
+        conn.set_progress_handler(lambda: time.monotonic() > deadline, 1000)
+        try:
+            conn.execute("ANALYZE")
+            conn.commit()
+            return True
+        except sqlite3.OperationalError:
+            conn.rollback()
+            return False
+        finally:
+            conn.set_progress_handler(None, 0)
+
+    @staticmethod
+    def _incremental_vacuum(conn: sqlite3.Connection, deadline: float) -> dict:
+        """Освобождать страницы шагами, пока не кончится бюджет времени"""
+
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA freelist_count")
+        free_before = cursor.fetchone()[0]
+        free_pages = free_before
+        steps = 0
+
+        while free_pages > 0 and time.monotonic() < deadline:
+            # Через execute() модуль sqlite3 делает только один шаг прагмы
+            # и освобождает одну страницу, executescript() выполняет её целиком
+            try:
+                conn.executescript(f"PRAGMA incremental_vacuum({maintenance_vacuum_step_pages});")
+            except sqlite3.OperationalError:
+                break
+            steps += 1
+
+            cursor.execute("PRAGMA freelist_count")
+            remaining = cursor.fetchone()[0]
+            if remaining >= free_pages:
+                break
+            free_pages = remaining
+
+        return {
+            "steps": steps,
+            "freed_pages": free_before - free_pages,
+            "free_pages_left": free_pages
+        }
+
+db_maintenance = DatabaseMaintenance()
@@ -1,45 +1,50 @@
 from typing import Optional, List, Tuple
 
 from app.database import get_db_connection
+from app.compression import compress_content, decompress_content
 
 class PostRepository:
     @staticmethod
     def create_post(title: str, content: str, author_id: int) -> int:
         """Создать новый пост"""
 
+        content, content_blob, content_codec = compress_content(content)
+
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "INSERT INTO posts (title, content, author_id) VALUES (?, ?, ?)",
-                (title, content, author_id)
+                """INSERT INTO posts (title, content, content_blob, content_codec, author_id)
+                VALUES (?, ?, ?, ?, ?)""",
+                (title, content, content_blob, content_codec, author_id)
             )
             post_id = cursor.lastrowid
             conn.commit()
             return post_id
     
     @staticmethod
-    def get_post_by_id(post_id: int) -> Optional[Tuple]:
-        """Получить пост по post_id: int"""
+    def get_post_author_id(post_id: int) -> Optional[int]:
+        """Получить author_id поста без чтения содержания"""
 
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT id, title, content, author_id FROM posts WHERE id = ?",
-                (post_id,)
-            )
-            return cursor.fetchone()
+            cursor.execute("SELECT author_id FROM posts WHERE id = ?", (post_id,))
+            row = cursor.fetchone()
+            return row[0] if row else None
     
     @staticmethod
     def update_post(post_id: int, title: str, content: str) -> bool:
         """Обновить пост"""
 
+        content, content_blob, content_codec = compress_content(content)
+
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """UPDATE posts 
-                SET title = ?, content = ?, updated_at = CURRENT_TIMESTAMP 
+                """UPDATE posts
+                SET title = ?, content = ?, content_blob = ?, content_codec = ?,
+                    updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?""",
-                (title, content, post_id)
+                (title, content, content_blob, content_codec, post_id)
             )
             conn.commit()
             return cursor.rowcount > 0
@@ -67,12 +72,54 @@ class PostRepository:
             total_pages = (total_posts + page_size - 1) // page_size
 
             cursor.execute('''
-                SELECT p.id, p.title, p.content, p.created_at, u.login as author_name
+                SELECT p.id, p.title, p.content, p.content_blob, p.content_codec,
+                       p.created_at, u.login as author_name
                 FROM posts p
                 JOIN users u ON p.author_id = u.id
                 ORDER BY p.created_at DESC
                 LIMIT ? OFFSET ?
             ''', (page_size, offset))
             
-            posts = cursor.fetchall()
-            return posts, total_posts, total_pages
\ No newline at end of file
+            posts = [
+                (post_id, title, decompress_content(content, content_blob, content_codec), created_at, author_name)
+                for post_id, title, content, content_blob, content_codec, created_at, author_name
+                in cursor.fetchall()
+            ]
+            return posts, total_posts, total_pages
+    
+    @staticmethod
+    def recompress_posts(batch_size: int = 500) -> int:
+        """
+        Пересжать содержание всех постов по текущим настройкам.
+        Возвращает количество измененных строк.
+        """
+
+        changed = 0
+        last_id = 0
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            while True:
+                cursor.execute(
+                    """SELECT id, content, content_blob, content_codec FROM posts
+                    WHERE id > ? ORDER BY id LIMIT ?""",
+                    (last_id, batch_size)
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+
+                for post_id, content, content_blob, content_codec in rows:
+                    text = decompress_content(content, content_blob, content_codec)
+                    new_row = compress_content(text)
+                    if new_row != (content, content_blob, content_codec):
+                        cursor.execute(
+                            "UPDATE posts SET content = ?, content_blob = ?, content_codec = ? WHERE id = ?",
+                            (*new_row, post_id)
+                        )
+                        changed += 1
+
+                conn.commit()
+                last_id = rows[-1][0]
+
+            return changed
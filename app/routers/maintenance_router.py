@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends
+
+from app.security import verify_token
+from app.maintenance import db_maintenance
+
+router = APIRouter(prefix="/api/maintenance", tags=["Maintenance API"])
+
+@router.get("/stats")
+def get_maintenance_stats(current_user: dict = Depends(verify_token)):
+    """Статистика фонового обслуживания БД"""
+
+    return {
+        "success": True,
+        "data": db_maintenance.get_stats()
+    }
\ No newline at end of file
@@ -21,8 +21,8 @@ class PostService:
     def update_post(self, post_id: int, title: str, content: str, current_user_id: int):
         """Обновить пост"""
 
-        post = self.post_repository.get_post_by_id(post_id)
-        if not post:
+        author_id = self.post_repository.get_post_author_id(post_id)
+        if author_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -31,8 +31,6 @@ class PostService:
                 }
             )
         
-        _, _, _, author_id = post
-        
         if author_id != current_user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -61,8 +59,8 @@ class PostService:
     def delete_post(self, post_id: int, current_user_id: int):
         """Удалить пост"""
         
-        post = self.post_repository.get_post_by_id(post_id)
-        if not post:
+        author_id = self.post_repository.get_post_author_id(post_id)
+        if author_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -71,8 +69,6 @@ class PostService:
                 }
             )
         
-        _, _, _, author_id = post
-        
         if author_id != current_user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
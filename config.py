@@ -1,8 +1,19 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     KEY: str
     ALGORITHM: str
+    POST_COMPRESSION_THRESHOLD: int = 1024 # байт, 0 - отключить сжатие
+    POST_COMPRESSION_LEVEL: int = Field(6, ge=-1, le=9)
+    MAINTENANCE_INTERVAL: int = Field(60, ge=1) # секунд между проходами обслуживания БД
+    MAINTENANCE_TRUNCATE_INTERVAL: int = Field(600, ge=1)
+    MAINTENANCE_ANALYZE_INTERVAL: int = Field(3600, ge=1)
+    MAINTENANCE_BUDGET_MS: int = Field(200, ge=1) # лимит времени на ANALYZE и incremental_vacuum за проход
+    MAINTENANCE_ANALYSIS_LIMIT: int = Field(400, ge=1)
+    MAINTENANCE_VACUUM_STEP_PAGES: int = Field(64, ge=1)
+    MAINTENANCE_MAX_LATENCY_MS: int = Field(200, ge=1)
+    MAINTENANCE_MAX_ACTIVE_REQUESTS: int = Field(4, ge=0)
     
     class Config:
         env_file = ".env"
@@ -10,4 +21,14 @@ class Settings(BaseSettings):
 settings = Settings()
 
 secret_key = settings.KEY
-algorithm = settings.ALGORITHM
\ No newline at end of file
+algorithm = settings.ALGORITHM
+post_compression_threshold = settings.POST_COMPRESSION_THRESHOLD
+post_compression_level = settings.POST_COMPRESSION_LEVEL
+maintenance_interval = settings.MAINTENANCE_INTERVAL
+maintenance_truncate_interval = settings.MAINTENANCE_TRUNCATE_INTERVAL
+maintenance_analyze_interval = settings.MAINTENANCE_ANALYZE_INTERVAL
+maintenance_budget_ms = settings.MAINTENANCE_BUDGET_MS
+maintenance_analysis_limit = settings.MAINTENANCE_ANALYSIS_LIMIT
+maintenance_vacuum_step_pages = settings.MAINTENANCE_VACUUM_STEP_PAGES
+maintenance_max_latency_ms = settings.MAINTENANCE_MAX_LATENCY_MS
+maintenance_max_active_requests = settings.MAINTENANCE_MAX_ACTIVE_REQUESTS
\ No newline at end of file
@@ -1,12 +1,39 @@
-from fastapi import FastAPI
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 
 from app.routers.auth_router import router as auth_router
 from app.routers.posts_router import router as posts_router
+from app.routers.maintenance_router import router as maintenance_router
 from app.database import init_database
+from app.maintenance import db_maintenance
 
 init_database()
 
-app = FastAPI(title="Social Network API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    db_maintenance.start()
+    try:
+        yield
+    finally:
+        # Поток может быть в середине прохода, не блокируем event loop
+        await asyncio.to_thread(db_maintenance.stop)
+
+app = FastAPI(title="Social Network API", lifespan=lifespan)
+
+@app.middleware("http")
+async def track_request_latency(request: Request, call_next):
+    """Время ответа нужно планировщику обслуживания БД"""
+
+    db_maintenance.request_started()
+    started = time.perf_counter()
+    try:
+        return await call_next(request)
+    finally:
+        db_maintenance.request_finished((time.perf_counter() - started) * 1000)
 
 app.include_router(auth_router)
-app.include_router(posts_router)
\ No newline at end of file
+app.include_router(posts_router)
+app.include_router(maintenance_router)
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""
+Оффлайн-пересжатие содержания постов по текущим настройкам
+POST_COMPRESSION_THRESHOLD / POST_COMPRESSION_LEVEL.
+
+Запуск: python recompress_posts.py
+"""
+
+from app.database import init_database
+from app.repositories.post_repository import PostRepository
+
+if __name__ == "__main__":
+    init_database()
+    changed = PostRepository.recompress_posts()
+    print(f"Пересжато постов: {changed}")
@@ -0,0 +1,20 @@
+"""
+Оффлайн-перевод существующей базы в режим auto_vacuum = INCREMENTAL,
+чтобы фоновое обслуживание могло освобождать страницы.
+VACUUM переписывает весь файл, запускать при остановленном приложении.
+
+Запуск: python vacuum_database.py
+"""
+
+from app.database import get_db_connection
+
+if __name__ == "__main__":
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA auto_vacuum")
+        if cursor.fetchone()[0] == 2:
+            print("База уже в режиме incremental vacuum")
+        else:
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            cursor.execute("VACUUM")
+            print("База переведена в режим incremental vacuum")
\ No newline at end of file